@@ -9,7 +9,6 @@ import attrs
 import pydra.mark
 import pydra.engine.specs
 from fileformats.generic import FsObject
-from fileformats.core.utils import set_cwd
 from fileformats.core.typing import PathType
 from fileformats.core import converter, FileSet
 from fileformats.application import Zip, Tar, TarGzip
@@ -103,9 +102,9 @@ def create_tar(
         format=format,
         ignore_zeros=ignore_zeros,
         encoding=encoding,
-    ) as tfile, set_cwd(base_dir):
+    ) as tfile:
         for fspath in in_file.fspaths:
-            tfile.add(relative_path(fspath, base_dir), filter=filter)
+            tfile.add(fspath, arcname=relative_path(fspath, base_dir), filter=filter)
 
     return Path(out_file)
 
@@ -192,17 +191,17 @@ def create_zip(
         allowZip64=allowZip64,
         compresslevel=compresslevel,
         **zip_kwargs,
-    ) as zfile, set_cwd(base_dir):
+    ) as zfile:
         for fspath in in_file.fspaths:
             fspath = Path(fspath)
             if fspath.is_dir():
                 for dpath, _, files in os.walk(fspath):
-                    zfile.write(relative_path(dpath, base_dir))
+                    zfile.write(dpath, arcname=relative_path(dpath, base_dir))
                     for fname in files:
                         fpath = os.path.join(dpath, fname)
-                        zfile.write(relative_path(fpath, base_dir))
+                        zfile.write(fpath, arcname=relative_path(fpath, base_dir))
             else:
-                zfile.write(relative_path(fspath, base_dir))
+                zfile.write(fspath, arcname=relative_path(fspath, base_dir))
     return Zip(out_file)
 
 
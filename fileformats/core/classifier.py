@@ -1,5 +1,5 @@
 import typing as ty
-from .decorators import classproperty
+from .decorators import classproperty, cached_classproperty
 from .exceptions import FormatDefinitionError
 
 
@@ -12,7 +12,7 @@ class Classifier:
         """Name of type to be used in __repr__. Defined here so it can be overridden"""
         return cls.__name__  # type: ignore
 
-    @classproperty
+    @cached_classproperty
     def namespace(cls) -> ty.Optional[str]:
         """The "namespace" the format belongs to under the "fileformats" umbrella
         namespace"""
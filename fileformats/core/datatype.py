@@ -4,6 +4,8 @@ import typing as ty
 from fileformats.core.typing import Self
 from abc import ABCMeta
 import importlib
+import functools
+from types import ModuleType
 import itertools
 from .exceptions import (
     FileFormatsError,
@@ -11,9 +13,10 @@ from .exceptions import (
     FormatConversionError,
     FormatRecognitionError,
 )
-from .decorators import classproperty
+from .decorators import classproperty, cached_classproperty
 from .utils import (
     subpackages,
+    subpackage_names,
     add_exc_note,
 )
 from .identification import (
@@ -24,6 +27,13 @@ from .identification import (
 from .classifier import Classifier
 
 
+@functools.lru_cache(maxsize=None)
+def _namespace_module(namespace: str) -> ModuleType:
+    """Imports the fileformats namespace package, caching the module so the import
+    machinery (and its lock) isn't invoked each time a MIME string is resolved"""
+    return importlib.import_module("fileformats." + namespace)
+
+
 class DataType(Classifier, metaclass=ABCMeta):
     """
     Base class for all file formats and fields.
@@ -104,7 +114,7 @@ class DataType(Classifier, metaclass=ABCMeta):
         for a non-MIME class in the MIME."""
         raise FileFormatsError(f"MIME type not defined for {cls} class")
 
-    @classproperty
+    @cached_classproperty
     def mime_like(cls) -> str:
         """Generates a "MIME-like" identifier from a format class. The fileformats
         package namespace forms a superset of IANA MIME registries. Formats with
@@ -135,14 +145,12 @@ class DataType(Classifier, metaclass=ABCMeta):
         type
             the corresponding file format class
         """
-        try:
-            namespace, format_name = mime_string.split("/")
-        except ValueError:
+        namespace, sep, format_name = mime_string.partition("/")
+        if not sep or "/" in format_name:
             raise FormatRecognitionError(
                 f"Format '{mime_string}' is not a valid MIME-like format of <namespace>/<format>"
-            ) from None
-        else:
-            namespace = namespace.replace("-", "_")
+            )
+        namespace = namespace.replace("-", "_")
         # Attempt to load file type using their `iana_mime` attribute
         try:
             return FileSet.formats_by_iana_mime[mime_string]
@@ -164,9 +172,9 @@ class DataType(Classifier, metaclass=ABCMeta):
             ]
             if not matching_name:
                 namespace_names = [
-                    p.__name__
-                    for p in subpackages()
-                    if p.__name__.split(".")[-1] not in IANA_MIME_TYPE_REGISTRIES
+                    n
+                    for n in subpackage_names()
+                    if n.rpartition(".")[2] not in IANA_MIME_TYPE_REGISTRIES
                 ]
                 class_name = from_mime_format_name(format_name)
                 raise FormatRecognitionError(
@@ -188,7 +196,7 @@ class DataType(Classifier, metaclass=ABCMeta):
         else:
             class_name = from_mime_format_name(format_name)
             try:
-                module = importlib.import_module("fileformats." + namespace)
+                module = _namespace_module(namespace)
             except ImportError:
                 raise FormatRecognitionError(
                     f"Did not find fileformats namespace package corresponding to {namespace} "
@@ -203,9 +211,7 @@ class DataType(Classifier, metaclass=ABCMeta):
                     parent_namespace: ty.Optional[str]
                     if "_" in namespace:
                         parent_namespace = namespace.split("_")[0]
-                        parent_module = importlib.import_module(
-                            "fileformats." + parent_namespace
-                        )
+                        parent_module = _namespace_module(parent_namespace)
                     else:
                         parent_namespace = parent_module = None
 
@@ -2,6 +2,7 @@ import sys
 import typing as ty
 from pathlib import Path
 import time
+import weakref
 from threading import RLock
 import fileformats.core
 from .fs_mount_identifier import FsMountIdentifier
@@ -10,16 +11,20 @@ from .fs_mount_identifier import FsMountIdentifier
 PropReturn = ty.TypeVar("PropReturn")
 
 
-__all__ = ["mtime_cached_property", "classproperty"]
+__all__ = ["mtime_cached_property", "classproperty", "cached_classproperty"]
 
 
 class mtime_cached_property:
     """A property that is cached until the mtimes of the files in the fileset are changed"""
 
+    # Number of locks that instances are spread across, so that threads accessing
+    # unrelated file-sets don't all contend for the same lock
+    NUM_LOCK_STRIPES = 64
+
     def __init__(self, func: ty.Callable[..., ty.Any]):
         self.func = func
         self.__doc__ = func.__doc__
-        self.lock = RLock()
+        self.locks = tuple(RLock() for _ in range(self.NUM_LOCK_STRIPES))
         self._cache_name = f"_{func.__name__}_mtime_cache"
 
     def __get__(
@@ -33,34 +38,35 @@ class mtime_cached_property:
             "Cannot use mtime_cached_property instance with "
             f"{type(instance).__name__!r} object, only FileSet objects."
         )
-        try:
-            mtimes, value = instance.__dict__[self._cache_name]
-        except KeyError:
-            pass
-        else:
-            if (
-                instance.mtimes == mtimes
-                and enough_time_has_elapsed_given_mtime_resolution(mtimes)
-            ):
-                return value
-            else:
-                del instance.__dict__[self._cache_name]
-        with self.lock:
+        # The mtimes are only read once per access and are read before the value is
+        # computed, so changes made to the files while it is being computed will
+        # invalidate the cached value on the next access
+        mtimes = instance.mtimes
+        # Cache hits don't require the lock as the (mtimes, value) tuple is replaced
+        # atomically
+        cached = instance.__dict__.get(self._cache_name)
+        if cached is not None and self._is_current(cached, mtimes):
+            return cached[1]
+        # Object addresses are aligned to 16 bytes, so drop the low bits that are
+        # always zero before selecting the lock stripe
+        with self.locks[(id(instance) >> 4) % self.NUM_LOCK_STRIPES]:
             # check if another thread filled cache while we awaited lock
-            try:
-                mtimes, value = instance.__dict__[self._cache_name]
-            except KeyError:
-                pass
-            else:
-                if (
-                    instance.mtimes == mtimes
-                    and enough_time_has_elapsed_given_mtime_resolution(mtimes)
-                ):
-                    return value
+            cached = instance.__dict__.get(self._cache_name)
+            if cached is not None and self._is_current(cached, mtimes):
+                return cached[1]
             value = self.func(instance)
-            instance.__dict__[self._cache_name] = (instance.mtimes, value)
+            instance.__dict__[self._cache_name] = (mtimes, value)
         return value
 
+    @staticmethod
+    def _is_current(
+        cached: ty.Tuple[ty.Tuple[ty.Tuple[str, int], ...], ty.Any],
+        mtimes: ty.Tuple[ty.Tuple[str, int], ...],
+    ) -> bool:
+        return cached[0] == mtimes and enough_time_has_elapsed_given_mtime_resolution(
+            mtimes  # type: ignore[arg-type]
+        )
+
 
 def classproperty(meth: ty.Callable[..., PropReturn]) -> PropReturn:
     """Access a @classmethod like a @property."""
@@ -68,6 +74,35 @@ def classproperty(meth: ty.Callable[..., PropReturn]) -> PropReturn:
     return classmethod(property(meth))  # type: ignore
 
 
+def cached_classproperty(meth: ty.Callable[..., PropReturn]) -> PropReturn:
+    """Access a @classmethod like a @property, evaluating it only once for each class
+    it is accessed from. For properties that are fixed by the class definition"""
+    return _CachedClassProperty(meth)  # type: ignore
+
+
+class _CachedClassProperty:
+    # Values are cached per descriptor (instead of on the class) so the properties of
+    # base classes can still be accessed via `super()` from within overriding properties
+
+    def __init__(self, func: ty.Callable[[ty.Type[ty.Any]], ty.Any]):
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.cache: ty.MutableMapping[ty.Type[ty.Any], ty.Any] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __get__(
+        self, obj: ty.Any, owner: ty.Optional[ty.Type[ty.Any]] = None
+    ) -> ty.Any:
+        if owner is None:
+            owner = type(obj)
+        try:
+            return self.cache[owner]
+        except KeyError:
+            value = self.cache[owner] = self.func(owner)
+            return value
+
+
 def validated_property(meth: ty.Callable[..., PropReturn]) -> PropReturn:
     """A property that is checked during validation of a FileSet"""
     prop = property(meth)
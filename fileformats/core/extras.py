@@ -6,17 +6,12 @@ from itertools import zip_longest
 import functools
 import urllib.error
 import fileformats.core
-from fileformats.core.typing import TypeAlias
+from fileformats.core.typing import TypeAlias, Self
 from .datatype import DataType
 from .converter_helpers import ConverterWrapper, ConverterSpec, SubtypeVar
 from .exceptions import FormatConversionError, FileFormatsExtrasError
 from .utils import import_extras_module, check_package_exists_on_pypi, add_exc_note
 
-if sys.version_info < (3, 11):
-    from typing_extensions import Self
-else:
-    from typing import Self
-
 if ty.TYPE_CHECKING:
     from pydra.engine.core import TaskBase
 
@@ -259,11 +254,14 @@ def converter(
             target = target_format
         # Handle string annotations
         if isinstance(source, str) or isinstance(target, str):
-            module_dict = importlib.import_module(task_spec.__module__).__dict__
+            try:
+                module_dict = sys.modules[task_spec.__module__].__dict__
+            except KeyError:
+                module_dict = importlib.import_module(task_spec.__module__).__dict__
             if isinstance(source, str):
-                source = eval(source, module_dict)
+                source = _eval_annotation(source, module_dict)
             if isinstance(target, str):
-                target = eval(target, module_dict)
+                target = _eval_annotation(target, module_dict)
         assert inspect.isclass(source) and inspect.isclass(target)
         if not issubclass(target, fileformats.core.FileSet):
             raise FormatConversionError(
@@ -287,3 +285,16 @@ def converter(
 
     # We pretend to return the original function, instead of the Pydra task or ConverterWrapper
     return decorator if task_spec is None else decorator(task_spec)  # type: ignore[return-value]
+
+
+def _eval_annotation(annotation: str, namespace: ty.Dict[str, ty.Any]) -> ty.Any:
+    """Evaluates a string annotation within the given namespace, resolving plain
+    (dotted) names by attribute lookup and only falling back to `eval` for more
+    complex expressions (e.g. parameterised generics)"""
+    parts = annotation.split(".")
+    if all(p.isidentifier() for p in parts):
+        try:
+            return functools.reduce(getattr, parts[1:], namespace[parts[0]])
+        except (KeyError, AttributeError):
+            pass
+    return eval(annotation, namespace)
@@ -14,6 +14,7 @@ import functools
 from pathlib import Path
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from fileformats.core.typing import Self
 from .utils import (
     fspaths_converter,
@@ -21,7 +22,12 @@ from .utils import (
     matching_source,
     import_extras_module,
 )
-from .decorators import mtime_cached_property, classproperty, VALIDATED_PROPERTY_FLAG
+from .decorators import (
+    mtime_cached_property,
+    classproperty,
+    cached_classproperty,
+    VALIDATED_PROPERTY_FLAG,
+)
 from .typing import FspathsInputType, CryptoMethod, PathType
 from .sampling import SampleFileGenerator
 from .identification import (
@@ -51,10 +57,42 @@ if ty.TYPE_CHECKING:
 
 FILE_CHUNK_LEN_DEFAULT = 8192
 
+# Minimum total size (in bytes) of the files in a file-set before they are hashed
+# concurrently, below which the overhead of the thread pool outweighs the benefit
+HASH_FILES_CONCURRENT_MIN_BYTES = 16 * 1024 * 1024
+
 
 logger = logging.getLogger("fileformats")
 
 
+def _worth_hashing_concurrently(fspaths: ty.Sequence[Path]) -> bool:
+    """Checks whether there are multiple CPUs available and multiple files to hash that
+    together are at least HASH_FILES_CONCURRENT_MIN_BYTES in size, stopping as soon as
+    the threshold is reached"""
+    if len(fspaths) < 2 or (os.cpu_count() or 1) < 2:
+        return False
+    total_size = 0
+    for fspath in fspaths:
+        try:
+            total_size += os.path.getsize(fspath)
+        except OSError:  # e.g. a broken symlink
+            continue
+        if total_size >= HASH_FILES_CONCURRENT_MIN_BYTES:
+            return True
+    return False
+
+
+def _read_file_chunks(fspath: Path, chunk_len: int) -> ty.Iterator[bytes]:
+    """Yields the contents of the file in byte chunks"""
+    if not fspath.is_file():
+        assert fspath.is_symlink()  # broken symlink
+        yield b"\x00"
+    else:
+        with open(fspath, "rb") as fp:
+            for chunk in iter(functools.partial(fp.read, chunk_len), b""):
+                yield chunk
+
+
 class FileSet(DataType):
     """
     The base class for all format types within the fileformats package. A generic
@@ -260,7 +298,7 @@ class FileSet(DataType):
         """
         return tuple((str(p), p.stat().st_mtime_ns) for p in sorted(self.fspaths))
 
-    @classproperty
+    @cached_classproperty
     def mime_type(cls) -> str:
         """Generates a MIME type (IANA) identifier from a format class. If an official
         IANA MIME type doesn't exist it will create one in the in the MIME style, e.g.
@@ -288,7 +326,7 @@ class FileSet(DataType):
         """Return extension that is guaranteed to be a string (i.e. not None)"""
         return cls.ext if cls.ext is not None else ""
 
-    @classproperty
+    @cached_classproperty
     def unconstrained(cls) -> bool:
         """Whether the file-format is unconstrained by extension, magic number or another
         constraint"""
@@ -758,6 +796,23 @@ class FileSet(DataType):
             }
         return cls._formats_by_name
 
+    @classproperty
+    def formats_by_ext(cls) -> ty.Dict[str, ty.Set[ty.Type["FileSet"]]]:
+        """a dictionary containing sets of formats by the extensions that constrain
+        them, i.e. formats that aren't constrained by their extension are omitted"""
+        if cls._formats_by_ext is None:
+            from fileformats.generic import File
+
+            formats_by_ext: ty.Dict[str, ty.Set[ty.Type["FileSet"]]] = {}
+            for f in FileSet.all_formats:
+                exts = f.possible_exts
+                if not issubclass(f, File) or None in exts:
+                    continue
+                for ext in exts:
+                    formats_by_ext.setdefault(ext, set()).add(f)  # type: ignore[arg-type]
+            cls._formats_by_ext = formats_by_ext
+        return cls._formats_by_ext
+
     @property
     def all_file_paths(self) -> ty.Iterable[Path]:
         """Paths of all files within the fileset"""
@@ -806,21 +861,10 @@ class FileSet(DataType):
             an iterator over the bytes contents of the file, chunked into 'chunk_len'
             chunks
         """
-        # If "relative_to" is not provided, get the common path between
-        if relative_to is None:
-            relative_to = Path(os.path.commonpath(list(self.fspaths)))
-            if all(p.is_file() and p.parent == relative_to for p in self.fspaths):
-                relative_to /= os.path.commonprefix(
-                    [p.name for p in self.fspaths]
-                ).rstrip(".")
+        relative_to = self._hash_relative_to(relative_to)
         # yield the absolute base path if using mtimes instead of contents
         if mtime:
             yield ("<base-path>", iter([str(relative_to.absolute()).encode()]))
-        relative_to_str = str(relative_to)
-        if relative_to.is_dir() and not relative_to_str.endswith(os.path.sep):
-            relative_to_str += os.path.sep
-
-        if mtime:
 
             def chunk_file(fspath: Path) -> ty.Iterator[bytes]:
                 """Yields a byte representation of the last modified time for the file"""
@@ -829,16 +873,37 @@ class FileSet(DataType):
         else:
 
             def chunk_file(fspath: Path) -> ty.Iterator[bytes]:
-                """Yields the contents of the file in byte chunks"""
-                if not fspath.is_file():
-                    assert fspath.is_symlink()  # broken symlink
-                    yield b"\x00"
-                else:
-                    with open(fspath, "rb") as fp:
-                        for chunk in iter(functools.partial(fp.read, chunk_len), b""):
-                            yield chunk
+                return _read_file_chunks(fspath, chunk_len)
+
+        for key, fspath in self._relative_file_paths(
+            relative_to, ignore_hidden_files, ignore_hidden_dirs
+        ):
+            yield (key, chunk_file(fspath))
 
-        def chunk_dir(fspath: Path) -> ty.Iterator[ty.Tuple[str, ty.Iterator[bytes]]]:
+    def _hash_relative_to(self, relative_to: ty.Optional[Path]) -> Path:
+        """Returns the base path that the keys of the hashed files are relative to"""
+        # If "relative_to" is not provided, get the common path between
+        if relative_to is None:
+            relative_to = Path(os.path.commonpath(list(self.fspaths)))
+            if all(p.is_file() and p.parent == relative_to for p in self.fspaths):
+                relative_to /= os.path.commonprefix(
+                    [p.name for p in self.fspaths]
+                ).rstrip(".")
+        return relative_to
+
+    def _relative_file_paths(
+        self,
+        relative_to: Path,
+        ignore_hidden_files: bool,
+        ignore_hidden_dirs: bool,
+    ) -> ty.Iterator[ty.Tuple[str, Path]]:
+        """Yields the paths of all the files within the file-set, along with their paths
+        relative to `relative_to`, in the order they are hashed"""
+        relative_to_str = str(relative_to)
+        if relative_to.is_dir() and not relative_to_str.endswith(os.path.sep):
+            relative_to_str += os.path.sep
+
+        def walk_dir(fspath: Path) -> ty.Iterator[ty.Tuple[str, Path]]:
             fspath = Path(fspath)
             for dpath_str, _, filenames in sorted(os.walk(fspath)):
                 # Sort in-place to guarantee order.
@@ -855,7 +920,7 @@ class FileSet(DataType):
                         continue
                     yield (
                         str((dpath / filename).relative_to(relative_to_str)),
-                        chunk_file(dpath / filename),
+                        dpath / filename,
                     )
 
         for key, fspath in sorted(
@@ -863,9 +928,9 @@ class FileSet(DataType):
             key=itemgetter(0),
         ):
             if fspath.is_dir():
-                yield from chunk_dir(fspath)
+                yield from walk_dir(fspath)
             else:
-                yield (key, chunk_file(fspath))
+                yield (key, fspath)
 
     def hash(
         self,
@@ -933,19 +998,45 @@ class FileSet(DataType):
         """
         if crypto is None:
             crypto = hashlib.sha256
-        file_hashes = {}
-        for path, bytes_iter in self.byte_chunks(
-            mtime=mtime,
-            chunk_len=chunk_len,
-            relative_to=relative_to,
-            ignore_hidden_files=ignore_hidden_files,
-            ignore_hidden_dirs=ignore_hidden_dirs,
-        ):
+
+        def hash_bytes(bytes_iter: ty.Iterator[bytes]) -> str:
             crypto_obj = crypto()
             for bytes_str in bytes_iter:
                 crypto_obj.update(bytes_str)
-            file_hashes[str(path)] = crypto_obj.hexdigest()
-        return file_hashes
+            return crypto_obj.hexdigest()
+
+        # Subclasses that override `byte_chunks` are hashed using their own chunks
+        if mtime or type(self).byte_chunks is not FileSet.byte_chunks:
+            return {
+                str(path): hash_bytes(bytes_iter)
+                for path, bytes_iter in self.byte_chunks(
+                    mtime=mtime,
+                    chunk_len=chunk_len,
+                    relative_to=relative_to,
+                    ignore_hidden_files=ignore_hidden_files,
+                    ignore_hidden_dirs=ignore_hidden_dirs,
+                )
+            }
+        # List the files to hash up front (which is needed anyway to check whether to
+        # hash them concurrently), so that directories are only walked once
+        file_paths = list(
+            self._relative_file_paths(
+                self._hash_relative_to(relative_to),
+                ignore_hidden_files,
+                ignore_hidden_dirs,
+            )
+        )
+
+        def hash_file(fspath: Path) -> str:
+            return hash_bytes(_read_file_chunks(fspath, chunk_len))
+
+        if _worth_hashing_concurrently([p for _, p in file_paths]):
+            # Files are read and hashed concurrently as both file reads and hashlib
+            # hashing of large buffers release the GIL
+            with ThreadPoolExecutor() as executor:
+                hashes = executor.map(hash_file, (p for _, p in file_paths))
+                return {key: hsh for (key, _), hsh in zip(file_paths, hashes)}
+        return {key: hash_file(fspath) for key, fspath in file_paths}
 
     def __bytes_repr__(
         self, cache: ty.Dict[ty.Any, str]  # pylint: disable=unused-argument
@@ -1206,8 +1297,13 @@ class FileSet(DataType):
         """Decompose an arbitrary file-system path into parent dir, stem and extension
         given the assumption on what constitutes an extension"""
         if mode == cls.ExtensionDecomposition.multiple:
-            ext = "".join(fspath.suffixes)
-            stem = fspath.name[: -len(ext)]
+            name = fspath.name
+            # Skip over leading dots (i.e. hidden files) as Path.suffixes does
+            i = name.find(".", len(name) - len(name.lstrip(".")))
+            if i < 0 or name.endswith("."):
+                stem, ext = name, ""
+            else:
+                stem, ext = name[:i], name[i:]
         elif mode == cls.ExtensionDecomposition.single:
             stem = fspath.stem
             ext = fspath.suffix
@@ -1746,5 +1842,6 @@ class FileSet(DataType):
     _all_formats: ty.Optional[ty.Set[ty.Type["FileSet"]]] = None
     _formats_by_iana_mime: ty.Optional[ty.Dict[str, ty.Type["FileSet"]]] = None
     _formats_by_name: ty.Optional[ty.Dict[str, ty.Set[ty.Type["FileSet"]]]] = None
+    _formats_by_ext: ty.Optional[ty.Dict[str, ty.Set[ty.Type["FileSet"]]]] = None
     _required_props: ty.Optional[ty.Tuple[str, ...]] = None
     _valid_class: ty.Optional[bool] = None
@@ -1,32 +1,65 @@
 import operator
+import functools
 from pathlib import Path
+from types import ModuleType
 import typing as ty
 import re
+import string
 from fileformats.core.exceptions import (
     FormatDefinitionError,
     FormatRecognitionError,
 )
 import fileformats.core
-from .utils import fspaths_converter, add_exc_note
+from .utils import fspaths_converter, add_exc_note, subpackages
 
 
 LIST_MIME = "+list-of"
-IANA_MIME_TYPE_REGISTRIES = [
-    "application",
-    "audio",
-    "font",
-    "image",
-    "message",
-    "model",
-    "multipart",
-    "text",
-    "video",
-]
-ALL_STANDARD_TYPE_REGISTRIES = IANA_MIME_TYPE_REGISTRIES + [
+IANA_MIME_TYPE_REGISTRIES = frozenset(
+    [
+        "application",
+        "audio",
+        "font",
+        "image",
+        "message",
+        "model",
+        "multipart",
+        "text",
+        "video",
+    ]
+)
+ALL_STANDARD_TYPE_REGISTRIES = IANA_MIME_TYPE_REGISTRIES | {
     "field",
     "testing",
     "testing_subpackage",
-]
+}
+
+# Patterns used to translate between class names and MIME format names. Class names
+# are translated in a single pass ("__X" -> "+x", "_X" -> ".x", "X" -> "-x"), whereas
+# MIME names are translated in separate passes as the substitutions can overlap
+_TO_MIME_NAME_RE = re.compile("__([A-Z])|_([A-Z])|([A-Z])")
+_TO_MIME_NAME_SEPARATORS = ("+", ".", "-")
+_TO_MIME_NAME_DASH_TABLE = str.maketrans(
+    {c: "-" + c.lower() for c in string.ascii_uppercase}
+)
+_FROM_MIME_DOT_RE = re.compile(r"(\.)(\w)")
+_FROM_MIME_PLUS_RE = re.compile(r"(\+)(\w)")
+_FROM_MIME_DASH_RE = re.compile(r"(-)(\w)")
+_FROM_MIME_NAME_SEPARATORS = {".": "_", "+": "__", "-": ""}
+
+# Number of bytes read from the start of a file to check the magic numbers of the
+# candidate formats against in `find_matching`
+MAGIC_HEADER_LENGTH = 4096
+
+# Reversed-character trie over the extensions of all installed file formats that are
+# constrained by their extension, along with the formats that aren't, lazily built on
+# the first call to `find_matching` and rebuilt if `FileSet.formats_by_ext` is reset
+_ext_index: ty.Optional[
+    ty.Tuple[
+        ty.Dict[str, ty.Set[ty.Type["fileformats.core.FileSet"]]],
+        ty.Dict[ty.Optional[str], ty.Any],
+        ty.Set[ty.Type["fileformats.core.FileSet"]],
+    ]
+] = None
 
 
 def find_matching(
@@ -56,25 +89,141 @@ def find_matching(
     list[FileSet]
         the file formats that match the given file-system paths
     """
-    import fileformats.core.mixin
-
     fspaths = fspaths_converter(fspaths)
     matches: ty.List[ty.Type["fileformats.core.FileSet"]] = []
     if candidates is None:
-        candidates = fileformats.core.FileSet.all_formats
+        candidates = _prefilter_by_ext(fspaths)
+    if len(fspaths) == 1:
+        candidates = _prefilter_by_magic(next(iter(fspaths)), candidates)
     for frmt in candidates:
+        # Check the namespace before attempting to match the paths, which can require
+        # the files to be read
+        namespace = frmt.namespace
+        if standard_only and namespace not in IANA_MIME_TYPE_REGISTRIES:
+            continue
+        if not include_generic and namespace == "generic":
+            continue
         if skip_unconstrained and frmt.unconstrained:
             continue
-        namespace = frmt.namespace
-        if (
-            frmt.matches(fspaths)
-            and (not standard_only or namespace in IANA_MIME_TYPE_REGISTRIES)
-            and (include_generic or namespace != "generic")
-        ):
+        if frmt.matches(fspaths):
             matches.append(frmt)
     return matches
 
 
+def _prefilter_by_ext(
+    fspaths: ty.Collection[Path],
+) -> ty.Set[ty.Type["fileformats.core.FileSet"]]:
+    """Selects the installed formats that could possibly match the given paths by
+    walking the extension trie backwards from the end of each path, so formats whose
+    extensions don't match any of the paths are never checked individually. Formats
+    that aren't constrained by their extension are always included.
+
+    Parameters
+    ----------
+    fspaths : Collection[Path]
+        the file-system paths to select the candidate formats for
+
+    Returns
+    -------
+    set[type[FileSet]]
+        the candidate formats
+    """
+    global _ext_index
+
+    formats_by_ext = fileformats.core.FileSet.formats_by_ext
+    if _ext_index is None or _ext_index[0] is not formats_by_ext:
+        trie: ty.Dict[ty.Optional[str], ty.Any] = {}
+        for ext, formats in formats_by_ext.items():
+            node = trie
+            for char in reversed(ext):
+                node = node.setdefault(char, {})
+            node.setdefault(None, set()).update(formats)
+        unindexed = fileformats.core.FileSet.all_formats.difference(
+            *formats_by_ext.values()
+        )
+        _ext_index = (formats_by_ext, trie, unindexed)
+    _, trie, unindexed = _ext_index
+    candidates = set(unindexed)
+    for fspath in fspaths:
+        node = trie
+        for char in reversed(str(fspath)):
+            try:
+                node = node[char]
+            except KeyError:
+                break
+            candidates.update(node.get(None, ()))
+    return candidates
+
+
+def _prefilter_by_magic(
+    fspath: Path,
+    candidates: ty.Iterable[ty.Type["fileformats.core.FileSet"]],
+) -> ty.Tuple[ty.Type["fileformats.core.FileSet"], ...]:
+    """Filters out the candidate file formats with magic numbers that don't match the
+    header of the given file, reading the header once instead of once per candidate.
+    Candidates that don't have a magic number, or where the magic number can't be
+    checked from the first MAGIC_HEADER_LENGTH bytes, are passed through untouched
+
+    Parameters
+    ----------
+    fspath : Path
+        the file to read the header from
+    candidates : Iterable[type[FileSet]]
+        the candidate formats to filter
+
+    Returns
+    -------
+    tuple[type[FileSet], ...]
+        the filtered candidates
+    """
+    candidates = tuple(candidates)
+    try:
+        with open(fspath, "rb") as f:
+            header = f.read(MAGIC_HEADER_LENGTH)
+    except OSError:  # e.g. a directory
+        return candidates
+    filtered = []
+    for frmt in candidates:
+        magic = _magic_number_bytes(frmt)
+        # Only filter on the magic number if the path would be selected as the primary
+        # path of the format (i.e. not if the primary could be an adjacent file)
+        if magic is not None and frmt.matching_exts([fspath]):
+            offset = frmt.magic_number_offset  # type: ignore[attr-defined]
+            if header[offset : offset + len(magic)] != magic:
+                continue
+        filtered.append(frmt)
+    return tuple(filtered)
+
+
+@functools.lru_cache(maxsize=None)
+def _magic_number_bytes(
+    frmt: ty.Type["fileformats.core.FileSet"],
+) -> ty.Optional[bytes]:
+    """Returns the magic number of a binary file format as bytes, or None if the format
+    doesn't have one that can be checked against the header read in
+    `_prefilter_by_magic`"""
+    import fileformats.generic
+    from .mixin import WithMagicNumber
+
+    if not (
+        issubclass(frmt, WithMagicNumber)
+        and issubclass(frmt, fileformats.generic.File)
+        and getattr(frmt, "binary", True)
+    ):
+        return None
+    magic = frmt.magic_number
+    if isinstance(magic, str):
+        try:
+            magic = bytes.fromhex(magic)
+        except ValueError:
+            return None  # Let the format raise the definition error itself
+    offset = frmt.magic_number_offset
+    if offset < 0 or offset + len(magic) > MAGIC_HEADER_LENGTH:
+        return None
+    return magic
+
+
+@functools.lru_cache(maxsize=4096)
 def from_mime(
     mime_str: str,
 ) -> ty.Union[ty.Type["fileformats.core.DataType"], "ty.Type[ty.Union]"]:
@@ -102,6 +251,7 @@ def from_mime(
     return fileformats.core.DataType.from_mime(mime_str)
 
 
+@functools.lru_cache(maxsize=4096)
 def to_mime(
     datatype: ty.Type["fileformats.core.DataType"], official: bool = True
 ) -> str:
@@ -149,11 +299,13 @@ def to_mime(
         ns = ns.replace("_", "-")
         class_name = to_mime_format_name(class_name)
         return ns + "/" + class_name
-    mime: str = datatype.mime_type if official else datatype.mime_like
+    mime: str
     if official:
         mime = datatype.mime_type
     else:
         mime = datatype.mime_like
+        # The reverse lookup is only performed on the first call for each datatype, as
+        # the results of both to_mime and from_mime are cached
         try:
             from_mime(mime)
         except FormatRecognitionError as e:
@@ -204,30 +356,22 @@ def from_paths(
         the instantiated file-sets
     """
     if candidates:
-        # Unwrap any nested tuples into a flat list of file-setclasses
+        # Unwrap any nested unions into a flat list of file-set classes, using a stack
+        # (pushed in reverse) so the order of the candidates is preserved
         unwrapped = []
-
-        def unwrap(candidate: ty.Type["fileformats.core.FileSet"]) -> None:
+        stack = list(reversed(candidates))
+        while stack:
+            candidate = stack.pop()
             if ty.get_origin(candidate) is ty.Union:
-                arg: ty.Type["fileformats.core.FileSet"]
-                for arg in ty.get_args(candidate):
-                    unwrap(arg)
+                stack.extend(reversed(ty.get_args(candidate)))
             else:
                 unwrapped.append(candidate)
-
-        for candidate in candidates:
-            unwrap(candidate)
         candidates = tuple(unwrapped)
         candidates_str = ", ".join(c.mime_like for c in candidates)
     else:
         # Use all installed file-set classes if no candidates are provided, sorted
         # alphabetically to ensure behaviour is consistent between runs
-        candidates = tuple(
-            sorted(
-                fileformats.core.FileSet.subclasses(),
-                key=operator.attrgetter("mime_like"),
-            )
-        )
+        candidates = _sorted_subclasses(tuple(subpackages()))
         candidates_str = "all installed"
 
     remaining = fspaths
@@ -237,9 +381,9 @@ def from_paths(
             remaining, common_ok=common_ok, **kwargs
         )
         filesets.extend(fsets)
-    if ignore:
-        ignore_re = re.compile(ignore)
-        remaining = [p for p in remaining if not ignore_re.match(p.name)]
+    if ignore and remaining:
+        ignore_match = re.compile(ignore).match
+        remaining = [p for p in remaining if ignore_match(p.name) is None]
     if remaining:
         raise FormatRecognitionError(
             "the following file-system paths were not recognised by any of the "
@@ -249,6 +393,22 @@ def from_paths(
     return filesets
 
 
+@functools.lru_cache(maxsize=8)
+def _sorted_subclasses(
+    subpkgs: ty.Tuple[ModuleType, ...],
+) -> ty.Tuple[ty.Type["fileformats.core.FileSet"], ...]:
+    """All installed file-set classes sorted by their "mime-like" string, cached by
+    the subpackages they are loaded from (which changes if the testing package is
+    included/excluded)"""
+    return tuple(
+        sorted(
+            fileformats.core.FileSet.subclasses(),
+            key=operator.attrgetter("mime_like"),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def to_mime_format_name(format_name: str) -> str:
     if "___" in format_name:
         raise FormatDefinitionError(
@@ -258,19 +418,42 @@ def to_mime_format_name(format_name: str) -> str:
     if format_name.startswith("_"):
         format_name = format_name[1:]
     format_name = format_name[0].lower() + format_name[1:]
-    format_name = re.sub("__([A-Z])", lambda m: "+" + m.group(1).lower(), format_name)
-    format_name = re.sub("_([A-Z])", lambda m: "." + m.group(1).lower(), format_name)
-    format_name = re.sub("([A-Z])", lambda m: "-" + m.group(1).lower(), format_name)
-    return format_name
+    if format_name.islower():
+        return format_name  # no capitals to translate into separators
+    if "_" not in format_name:
+        # Without underscores, capitals can only map to dashes, so translate per char
+        return format_name.translate(_TO_MIME_NAME_DASH_TABLE)
+    return _TO_MIME_NAME_RE.sub(_to_mime_name_repl, format_name)
 
 
+def _to_mime_name_repl(match: ty.Match[str]) -> str:
+    # Only one of the groups in the pattern can match, so lastindex is the group that did
+    group = match.lastindex
+    assert group
+    return _TO_MIME_NAME_SEPARATORS[group - 1] + match.group(group).lower()
+
+
+@functools.lru_cache(maxsize=None)
 def from_mime_format_name(format_name: str) -> str:
     if format_name.startswith("x-"):
         format_name = format_name[2:]
-    if re.match(r"^[0-9]", format_name):
+    if format_name[:1].isascii() and format_name[:1].isdigit():
         format_name = "_" + format_name
     format_name = format_name.capitalize()
-    format_name = re.sub(r"(\.)(\w)", lambda m: "_" + m.group(2).upper(), format_name)
-    format_name = re.sub(r"(\+)(\w)", lambda m: "__" + m.group(2).upper(), format_name)
-    format_name = re.sub(r"(-)(\w)", lambda m: m.group(2).upper(), format_name)
+    format_name = _FROM_MIME_DOT_RE.sub(_from_mime_name_repl, format_name)
+    format_name = _FROM_MIME_PLUS_RE.sub(_from_mime_name_repl, format_name)
+    format_name = _FROM_MIME_DASH_RE.sub(_from_mime_name_repl, format_name)
     return format_name
+
+
+def _from_mime_name_repl(match: ty.Match[str]) -> str:
+    return _FROM_MIME_NAME_SEPARATORS[match.group(1)] + match.group(2).upper()
+
+
+def _mime_cache_clear() -> None:
+    """Clears the cached results of the MIME conversion functions, which need to be
+    reset if the set of available format classes changes"""
+    from_mime.cache_clear()
+    to_mime.cache_clear()
+    to_mime_format_name.cache_clear()
+    from_mime_format_name.cache_clear()
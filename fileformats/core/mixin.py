@@ -5,7 +5,7 @@ import logging
 from .datatype import DataType
 import fileformats.core
 from .utils import describe_task, matching_source, get_optional_type
-from .decorators import validated_property, classproperty
+from .decorators import validated_property, classproperty, cached_classproperty
 from .identification import to_mime_format_name
 from .converter_helpers import SubtypeVar, ConverterSpec
 from .classifier import Classifier
@@ -682,7 +682,7 @@ class WithClassifiers:
         else:
             super().register_converter(source_format, converter_spec)  # type: ignore[misc]
 
-    @classproperty
+    @cached_classproperty
     def namespace(cls) -> ty.Optional[str]:
         """The "namespace" the format belongs to under the "fileformats" umbrella
         namespace"""
@@ -41,11 +41,10 @@ class SampleFileGenerator:
         )
 
     def _generate_fname_stem(self) -> str:
-        return "".join(
-            self.rng.choices(
-                string.ascii_letters + string.digits, k=self.FNAME_STEM_LENGTH
-            )
-        )
+        # Draw all the random bits at once and format them as hex instead of drawing
+        # each character separately
+        length = self.FNAME_STEM_LENGTH
+        return format(self.rng.getrandbits(4 * length), f"0{length}x")
 
     @cached_property
     def rng(self) -> random.Random:
@@ -55,7 +54,9 @@ class SampleFileGenerator:
         self, binary: bool, fill: int = FILE_FILL_LENGTH_DEFAULT
     ) -> ty.Union[str, bytes]:
         if binary:
-            return bytes(self.rng.choices(list(range(256)), k=fill))
+            if not fill:
+                return b""
+            return self.rng.getrandbits(8 * fill).to_bytes(fill, "little")
         else:
             return "".join(self.rng.choices(string.printable, k=fill))
 
@@ -2,6 +2,7 @@ from pathlib import Path
 import time
 from fileformats.core.decorators import (
     mtime_cached_property,
+    cached_classproperty,
     enough_time_has_elapsed_given_mtime_resolution,
 )
 from fileformats.generic import UnicodeFile
@@ -43,3 +44,25 @@ def test_not_enough_time_has_elapsed_given_mtime_resolution():
     assert not enough_time_has_elapsed_given_mtime_resolution(
         [("", 110), ("", 220), ("", 300)], 301
     )
+
+
+def test_cached_classproperty():
+    class A:
+        calls = 0
+
+        @cached_classproperty
+        def prop(cls):
+            cls.calls += 1
+            return "a"
+
+    class B(A):
+        @cached_classproperty
+        def prop(cls):
+            return super().prop + "b"
+
+    assert A.prop == "a"
+    assert A.prop == "a"
+    assert A.calls == 1
+    assert B.prop == "ab"
+    assert B().prop == "ab"
+    assert B.calls == 2
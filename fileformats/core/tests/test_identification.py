@@ -11,10 +11,17 @@ from fileformats.core import (
     FileSet,
 )
 from fileformats.generic import File, SetOf
+from fileformats.core.identification import (
+    _prefilter_by_magic,
+    to_mime_format_name,
+    from_mime_format_name,
+)
 from fileformats.core.exceptions import FormatRecognitionError
 from fileformats.testing import Foo, Bar
+from fileformats.testing.headers import ImageWithHeader
 from fileformats.application import Json, Yaml, Zip
 from fileformats.text import Plain, TextFile
+from fileformats.image import Png, Gif
 import fileformats.text
 
 
@@ -32,6 +39,57 @@ def test_format_detection(work_dir):
     ]
 
 
+def test_format_detection_ext_prefilter(work_dir):
+    fspaths = [work_dir / "text.txt", work_dir / "image.png", work_dir / "data.json"]
+    for fspath in fspaths:
+        with open(fspath, "w") as f:
+            f.write("sample text")
+        assert set(find_matching(fspath)) == set(
+            find_matching(fspath, candidates=FileSet.all_formats)
+        )
+
+
+def test_prefilter_by_magic(work_dir):
+    png_header = bytes.fromhex("89504e470d0a1a0a")
+    png_file = work_dir / "image.png"
+    png_file.write_bytes(png_header + b"sample data")
+    gif_file = work_dir / "image.gif"
+    gif_file.write_bytes(png_header + b"sample data")
+    assert _prefilter_by_magic(png_file, [Png, Gif, TextFile]) == (Png, Gif, TextFile)
+    assert _prefilter_by_magic(gif_file, [Png, Gif, TextFile]) == (Png, TextFile)
+    gif_file.write_bytes(b"GIF89a" + b"sample data")
+    assert _prefilter_by_magic(gif_file, [Png, Gif, TextFile]) == (Png, Gif, TextFile)
+
+
+def test_format_detection_magic_prefilter(work_dir):
+    fspaths = [work_dir / "image.png", work_dir / "image.gif", work_dir / "data.bin"]
+    for fspath in fspaths:
+        with open(fspath, "wb") as f:
+            f.write(bytes.fromhex("89504e470d0a1a0a") + b"sample data")
+        # Check the prefilters against matching all formats without prefiltering
+        expected = [
+            f
+            for f in FileSet.all_formats
+            if not f.unconstrained and f.namespace != "generic" and f.matches(fspath)
+        ]
+        assert set(find_matching(fspath)) == set(expected)
+
+
+def test_formats_by_ext():
+    assert fileformats.text.TextFile in FileSet.formats_by_ext[".txt"]
+    assert fileformats.text.Prs_Fallenstein_Rst in FileSet.formats_by_ext[".rst"]
+    assert not any(File in s for s in FileSet.formats_by_ext.values())
+
+
+def test_format_detection_adjacent_file(work_dir):
+    img_file = work_dir / "a.img"
+    img_file.write_text("image")
+    assert find_matching(img_file, candidates=[ImageWithHeader]) == []
+    # Check that the header is picked up once it has been created
+    (work_dir / "a.hdr").write_text("header")
+    assert find_matching(img_file, candidates=[ImageWithHeader]) == [ImageWithHeader]
+
+
 def test_to_from_mime_roundtrip():
     mime_str = to_mime(Foo, official=False)
     assert isinstance(mime_str, str)
@@ -56,6 +114,34 @@ def test_to_from_list_union_mime_roundtrip():
     assert from_mime(mime_str) == ty.List[ty.Union[Foo, Bar]]
 
 
+def test_to_from_mime_cached():
+    mime_str = to_mime(ty.List[Foo], official=False)
+    hits = to_mime.cache_info().hits
+    assert to_mime(ty.List[Foo], official=False) == mime_str
+    assert to_mime.cache_info().hits == hits + 1
+    assert from_mime(mime_str) is from_mime(mime_str)
+
+
+@pytest.mark.parametrize(
+    "format_name,mime_name",
+    [
+        ("Plain", "plain"),
+        ("TiffFx", "tiff-fx"),
+        ("Vnd_Oasis__Json", "vnd.oasis+json"),
+        ("_3gpp", "3gpp"),
+    ],
+)
+def test_mime_format_name_roundtrip(format_name, mime_name):
+    assert to_mime_format_name(format_name) == mime_name
+    assert from_mime_format_name(mime_name) == format_name
+
+
+@pytest.mark.parametrize("mime_str", ["text", "text/plain/extra"])
+def test_from_mime_invalid(mime_str):
+    with pytest.raises(FormatRecognitionError, match="is not a valid MIME-like"):
+        from_mime(mime_str)
+
+
 def test_official_mime_fail():
     with pytest.raises(TypeError, match="as it is not a proper file-type"):
         to_mime(ty.List[Foo], official=True)
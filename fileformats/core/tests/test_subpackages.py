@@ -1,6 +1,7 @@
 from fileformats.core.utils import (
     include_testing_package,
     subpackages,
+    subpackage_names,
 )
 
 
@@ -20,3 +21,19 @@ def test_include_testing_flag():
         include_testing_package(True)
     assert "fileformats.testing" not in [p.__name__ for p in pkgs]
     assert "fileformats.testing" in [p.__name__ for p in subpackages()]
+
+
+def test_subpackages_cached():
+    from fileformats.core.utils import _subpackages_cache
+
+    pkgs = list(subpackages())
+    assert tuple(subpackage_names()) in _subpackages_cache
+    assert list(subpackages()) == pkgs
+    subpackages.cache_clear()
+    assert not _subpackages_cache
+    assert list(subpackages()) == pkgs
+
+
+def test_subpackage_names():
+    assert subpackage_names() == [p.__name__ for p in subpackages()]
+    assert "fileformats.testing" not in subpackage_names(exclude=("core", "testing"))
@@ -1,13 +1,25 @@
 from pathlib import Path
 import os.path
 import random
+import sys
 import shutil
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from fileformats.core import FileSet, validated_property
 from fileformats.generic import File, BinaryFile, Directory, FsObject
 from fileformats.core.mixin import WithSeparateHeader
 from fileformats.core.exceptions import UnsatisfiableCopyModeError
+import fileformats.core.fileset
+import fileformats.core.utils
+from fileformats.core.utils import (
+    fspaths_converter,
+    set_cwd,
+    check_package_exists_on_pypi,
+    matching_source,
+)
 from conftest import write_test_file
 
 
@@ -279,6 +291,128 @@ def test_decompose_fspaths(work_dir):
     assert decomposed == [(work_dir, "file.luigi", ".mario")]
 
 
+def test_decompose_fspath_multiple(work_dir):
+    mode = FileSet.ExtensionDecomposition.multiple
+    for name, stem, ext in [
+        ("x.luigi.mario", "x", ".luigi.mario"),
+        ("x", "x", ""),
+        ("x.", "x.", ""),
+        (".hidden", ".hidden", ""),
+        (".hidden.luigi.mario", ".hidden", ".luigi.mario"),
+    ]:
+        assert FileSet.decompose_fspath(work_dir / name, mode=mode) == (
+            work_dir,
+            stem,
+            ext,
+        )
+
+
+def test_fspaths_converter(work_dir):
+    abs_path = work_dir / "x.mario"
+    with set_cwd(work_dir):
+        assert fspaths_converter(["x.mario", str(abs_path), Path("y.mario")]) == {
+            abs_path,
+            work_dir / "y.mario",
+        }
+        assert fspaths_converter("./x.mario") == {abs_path}
+    fileset = Mario.mock(abs_path)
+    assert fspaths_converter(fileset) is fileset.fspaths
+    assert fspaths_converter(fileset.fspaths) is fileset.fspaths
+
+
+def test_matching_source(tmp_path: Path, monkeypatch):
+    import importlib.util
+
+    def load_module(name: str, src: str):
+        mod_path = tmp_path / f"{name}.py"
+        mod_path.write_text(src)
+        spec = importlib.util.spec_from_file_location(name, mod_path)
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    src = "def task():\n    pass\n"
+    mod_a = load_module("matching_source_a", src)
+    mod_b = load_module("matching_source_b", src)
+    mod_c = load_module("matching_source_c", src + "\n\ndef other():\n    pass\n")
+    assert matching_source(mod_a.task, mod_a.task)
+    assert matching_source(mod_a.task, mod_b.task)
+    assert not matching_source(mod_a.task, mod_c.task)
+
+
+def test_matching_source_zipimport(tmp_path: Path, monkeypatch):
+    import importlib
+    import zipfile
+
+    zip_path = tmp_path / "tasks.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for name in ("zipped_source_a", "zipped_source_b"):
+            zf.writestr(f"{name}.py", "def task():\n    pass\n")
+    monkeypatch.syspath_prepend(str(zip_path))
+    modules = []
+    for name in ("zipped_source_a", "zipped_source_b"):
+        module = importlib.import_module(name)
+        monkeypatch.setitem(sys.modules, name, module)
+        modules.append(module)
+    assert matching_source(modules[0].task, modules[1].task)
+    # Check modules on disk match zipped modules with the same source
+    disk_dir = tmp_path / "disk"
+    disk_dir.mkdir()
+    (disk_dir / "unzipped_source.py").write_text("def task():\n    pass\n")
+    monkeypatch.syspath_prepend(str(disk_dir))
+    unzipped = importlib.import_module("unzipped_source")
+    monkeypatch.setitem(sys.modules, "unzipped_source", unzipped)
+    assert matching_source(unzipped.task, modules[0].task)
+
+
+def test_check_package_exists_on_pypi_cached(tmp_path: Path, monkeypatch):
+    requested = []
+
+    def mock_urlopen(request, timeout):
+        requested.append(request.full_url)
+        if "missing" in request.full_url:
+            raise urllib.error.HTTPError(request.full_url, 404, "", {}, None)
+
+    monkeypatch.setattr(fileformats.core.utils, "PYPI_CACHE_PATH", tmp_path / "p.json")
+    monkeypatch.setattr(urllib.request, "urlopen", mock_urlopen)
+    check_package_exists_on_pypi.cache_clear()
+    assert check_package_exists_on_pypi("fileformats-present-extras")
+    assert not check_package_exists_on_pypi("fileformats-missing-extras")
+    assert len(requested) == 2
+    # Check the on-disk cache is used once the in-memory cache is cleared
+    check_package_exists_on_pypi.cache_clear()
+    assert check_package_exists_on_pypi("fileformats-present-extras")
+    assert not check_package_exists_on_pypi("fileformats-missing-extras")
+    assert len(requested) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["p.json"]
+    # Check the on-disk cache is bypassed when disabled
+    monkeypatch.setenv("FILEFORMATS_NO_PYPI_CACHE", "1")
+    check_package_exists_on_pypi.cache_clear()
+    assert check_package_exists_on_pypi("fileformats-present-extras")
+    assert len(requested) == 3
+    monkeypatch.delenv("FILEFORMATS_NO_PYPI_CACHE")
+    # Check that cache files that don't contain a JSON object are ignored
+    (tmp_path / "p.json").write_text("[]")
+    check_package_exists_on_pypi.cache_clear()
+    assert check_package_exists_on_pypi("fileformats-present-extras")
+    assert len(requested) == 4
+    # Check that malformed entries in the cache are treated as misses
+    (tmp_path / "p.json").write_text(
+        '{"fileformats-present-extras": [true, "yesterday"]}'
+    )
+    check_package_exists_on_pypi.cache_clear()
+    assert check_package_exists_on_pypi("fileformats-present-extras")
+    assert len(requested) == 5
+    # Check that the on-disk cache is skipped if the home directory can't be found
+    monkeypatch.setattr(fileformats.core.utils, "PYPI_CACHE_PATH", "~/p.json")
+    monkeypatch.setattr(os.path, "expanduser", lambda p: p)
+    check_package_exists_on_pypi.cache_clear()
+    assert check_package_exists_on_pypi("fileformats-present-extras")
+    assert len(requested) == 6
+    check_package_exists_on_pypi.cache_clear()
+
+
 def test_hash(tmp_path: Path):
     file_1 = tmp_path / "file_1.txt"
     file_2 = tmp_path / "file_2.txt"
@@ -365,3 +499,28 @@ def test_hash_files(fsobject: FsObject, work_dir: Path, dest_dir: Path):
     )
     cpy = fsobject.copy(dest_dir)
     assert cpy.hash_files() == fsobject.hash_files()
+
+
+def test_hash_files_concurrent(bowser_dir: Bowser, monkeypatch):
+    serial_hashes = bowser_dir.hash_files()
+    executors = []
+
+    class MockThreadPoolExecutor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            executors.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(
+        fileformats.core.fileset, "ThreadPoolExecutor", MockThreadPoolExecutor
+    )
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    # Check the files aren't hashed concurrently until they reach the size threshold
+    assert bowser_dir.hash_files() == serial_hashes
+    assert not executors
+    monkeypatch.setattr(fileformats.core.fileset, "HASH_FILES_CONCURRENT_MIN_BYTES", 0)
+    assert bowser_dir.hash_files() == serial_hashes
+    assert len(executors) == 1
+    # Check mtimes and single files are never hashed concurrently
+    bowser_dir.hash_files(mtime=True)
+    File(bowser_dir.fspath / "0.mario").hash_files()
+    assert len(executors) == 1
@@ -1,20 +1,24 @@
 import importlib
+import importlib.util
+import functools
+import hashlib
+import json
+import time
 from pathlib import Path
 import inspect
 import typing as ty
-from types import ModuleType
-import urllib.request
-import urllib.error
+from types import ModuleType, FunctionType
 import os
+import sys
 import logging
-import pkgutil
 from contextlib import contextmanager
 from .typing import FspathsInputType
-import fileformats.core
+import fileformats
 from fileformats.core.exceptions import FormatDefinitionError
 
 if ty.TYPE_CHECKING:
     import pydra.engine.core
+    import fileformats.core
 
 logger = logging.getLogger("fileformats")
 
@@ -23,6 +27,24 @@ _excluded_subpackages = set(
     ["core", "testing", "serialization", "archive", "document", "conftest"]
 )
 
+# Imported subpackages cached by the names of the subpackages to import
+_subpackages_cache: ty.Dict[ty.Tuple[str, ...], ty.Tuple[ModuleType, ...]] = {}
+
+# Digests of module source code cached by source file, along with the mtime of the file
+_source_digests: ty.Dict[str, ty.Tuple[int, bytes]] = {}
+
+# Location of the on-disk cache of the packages found (or not) on PyPI and the time
+# (in seconds) after which the cached results are rechecked. The on-disk cache can be
+# disabled by setting the FILEFORMATS_NO_PYPI_CACHE environment variable. Empty or
+# relative values of XDG_CACHE_HOME are ignored, as required by the XDG spec
+_xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or ""
+PYPI_CACHE_PATH = os.path.join(
+    _xdg_cache_home if os.path.isabs(_xdg_cache_home) else "~/.cache",
+    "fileformats",
+    "pypi_exists.json",
+)
+PYPI_CACHE_TIMEOUT = 24 * 60 * 60
+
 T = ty.TypeVar("T")
 
 
@@ -36,17 +58,22 @@ def include_testing_package(flag: bool = True) -> None:
     flag : bool
         whether to include the testing package or not
     """
+    from .identification import _mime_cache_clear
+
     global _excluded_subpackages
     if flag:
         _excluded_subpackages.remove("testing")
     else:
         _excluded_subpackages.add("testing")
+    _subpackages_cache.clear()
+    _mime_cache_clear()
 
 
 def subpackages(
     exclude: ty.Iterable[str] = _excluded_subpackages,
 ) -> ty.Generator[ModuleType, None, None]:
-    """Iterates over all subpackages within the fileformats namespace
+    """Iterates over all subpackages within the fileformats namespace. The imported
+    subpackages are cached for each set of excluded names
 
     Parameters
     ----------
@@ -58,12 +85,58 @@ def subpackages(
     module
         all modules within the package
     """
-    for mod_info in pkgutil.iter_modules(
-        fileformats.__path__, prefix=fileformats.__package__ + "."
-    ):
-        if mod_info.name.split(".")[-1] in exclude:
-            continue
-        yield importlib.import_module(mod_info.name)
+    names = tuple(subpackage_names(exclude))
+    try:
+        subpkgs = _subpackages_cache[names]
+    except KeyError:
+        subpkgs = _subpackages_cache[names] = tuple(
+            importlib.import_module(name) for name in names
+        )
+    yield from subpkgs
+
+
+def subpackage_names(
+    exclude: ty.Iterable[str] = _excluded_subpackages,
+) -> ty.List[str]:
+    """Lists the names of the subpackages within the fileformats namespace without
+    importing them
+
+    Parameters
+    ----------
+    exclude : ty.Sequence[str], optional
+        whether to include the testing subpackage, by default ["core", "testing"]
+
+    Returns
+    -------
+    list[str]
+        the full names of the modules within the package
+    """
+    exclude = frozenset(exclude)
+    return [
+        n
+        for n in _all_subpackage_names(tuple(fileformats.__path__))
+        if n.rpartition(".")[2] not in exclude
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _all_subpackage_names(path: ty.Tuple[str, ...]) -> ty.Tuple[str, ...]:
+    # The directories of the namespace package are only rescanned if its path changes
+    # (e.g. if sys.path is extended to include another distribution)
+    import pkgutil  # only needed the first time the subpackages are listed
+
+    return tuple(
+        mod_info.name
+        for mod_info in pkgutil.iter_modules(path, prefix=fileformats.__package__ + ".")
+    )
+
+
+def _subpackages_cache_clear() -> None:
+    _subpackages_cache.clear()
+    _all_subpackage_names.cache_clear()
+
+
+subpackages.cache_clear = _subpackages_cache_clear  # type: ignore[attr-defined]
 
 
 @contextmanager
@@ -86,13 +159,31 @@ def set_cwd(path: Path) -> ty.Generator[Path, None, None]:
 
 def fspaths_converter(fspaths: FspathsInputType) -> ty.FrozenSet[Path]:
     """Ensures fs-paths are a set of pathlib.Path"""
-    import fileformats.core
-
+    # fileformats.core will have finished loading (and been bound to the `fileformats`
+    # namespace imported above) by the time any file-sets are created, so it doesn't
+    # need to be re-imported here
     if isinstance(fspaths, fileformats.core.FileSet):
-        fspaths = fspaths.fspaths
-    elif isinstance(fspaths, (str, os.PathLike)):
-        fspaths = [Path(fspaths)]
-    return frozenset(Path(p).absolute() for p in fspaths)
+        return fspaths.fspaths  # already converted when the file-set was created
+    if isinstance(fspaths, frozenset) and all(
+        isinstance(p, Path) and p.is_absolute() for p in fspaths
+    ):
+        return fspaths  # e.g. the fspaths of another file-set
+    if isinstance(fspaths, (str, os.PathLike)):
+        fspaths = [fspaths]
+    # Only look up the current working directory once, and only if required
+    cwd: ty.Optional[str] = None
+    abs_paths = []
+    for fspath in fspaths:
+        if isinstance(fspath, Path) and fspath.is_absolute():
+            abs_paths.append(fspath)  # no need to rewrap absolute paths
+            continue
+        fspath = os.fspath(fspath)
+        if not os.path.isabs(fspath):
+            if cwd is None:
+                cwd = os.getcwd()
+            fspath = os.path.join(cwd, fspath)
+        abs_paths.append(Path(fspath))
+    return frozenset(abs_paths)
 
 
 def add_exc_note(e: Exception, note: str) -> Exception:
@@ -129,15 +220,32 @@ def describe_task(task: "pydra.engine.task.TaskBase") -> str:
 
     if isinstance(task, ConverterWrapper):
         task = task.task_spec
-    if inspect.isfunction(task):
+    if isinstance(task, FunctionType):
+        try:
+            pickled_func = task().inputs._func
+        except Exception as e:
+            return f"{task} (Failed to load task function: {e})"
+        # Only import cloudpickle when there is actually a pickled function to load
         import cloudpickle
 
         try:
-            task = cloudpickle.loads(task().inputs._func)
+            task = cloudpickle.loads(pickled_func)
         except Exception as e:
             return f"{task} (Failed to load task function: {e})"
-    src_file = inspect.getsourcefile(task)
-    src_line = inspect.getsourcelines(task)[-1]
+    try:
+        code = task.__code__
+    except AttributeError:
+        # Task classes don't have code objects so we need to locate them in the source.
+        # Only the line number is required so use findsource directly instead of
+        # getsourcelines, which also extracts the lines of the class block
+        try:
+            src_file = inspect.getsourcefile(task)
+            src_line = inspect.findsource(task)[1] + 1
+        except (OSError, TypeError) as e:
+            return f"{task} (Failed to locate task source: {e})"
+    else:
+        src_file = code.co_filename
+        src_line = code.co_firstlineno
     return f"{task} (defined at line {src_line} of {src_file})"
 
 
@@ -146,34 +254,119 @@ def matching_source(
 ) -> bool:
     """Checks to see if the tasks share the same source code but are just getting reimported
     for some unknown reason"""
-    mod1 = inspect.getmodule(task1)
-    mod2 = inspect.getmodule(task2)
+    if task1 is task2:
+        return True
+    mod1 = _task_module(task1)
+    mod2 = _task_module(task2)
     assert mod1 and mod2
-    return inspect.getsource(mod1) == inspect.getsource(mod2)
+    if mod1 is mod2:
+        return True
+    return _source_digest(mod1) == _source_digest(mod2)
 
 
+def _task_module(task: ty.Callable[..., ty.Any]) -> ty.Optional[ModuleType]:
+    """Returns the module a task is defined in, looking it up directly in sys.modules
+    where possible as inspect.getmodule can fall back to scanning all loaded modules"""
+    try:
+        return sys.modules[task.__module__]
+    except (AttributeError, KeyError):
+        return inspect.getmodule(task)
+
+
+def _source_digest(module: ModuleType) -> bytes:
+    """Returns a digest of the source code of a module, which is cached until the
+    modification time of the source file changes"""
+    src_file = inspect.getsourcefile(module)
+    mtime: ty.Optional[int] = None
+    if src_file is not None:
+        try:
+            mtime = os.stat(src_file).st_mtime_ns
+        except OSError:
+            pass  # e.g. modules imported from zip files, read via their loader
+    if src_file is None or mtime is None:
+        # The digest can't be cached without the mtime of the source file
+        return hashlib.sha256(inspect.getsource(module).encode()).digest()
+    try:
+        cached_mtime, digest = _source_digests[src_file]
+    except KeyError:
+        pass
+    else:
+        if cached_mtime == mtime:
+            return digest
+    digest = hashlib.sha256(inspect.getsource(module).encode()).digest()
+    _source_digests[src_file] = (mtime, digest)
+    return digest
+
+
+@functools.lru_cache(maxsize=512)
 def check_package_exists_on_pypi(package_name: str, timeout: int = 5) -> bool:
-    """Check if a package exists on PyPI
+    """Check if a package exists on PyPI. Results are cached both in memory and on
+    disk (for `PYPI_CACHE_TIMEOUT` seconds) to avoid repeated network round-trips
 
     Parameters
     ----------
     package_name : str
         the name of the package to check for
+    timeout : int
+        the timeout (in seconds) of the request to PyPI
 
     Returns
     -------
     bool
         whether the package exists on PyPI or not
     """
+    use_cache = not os.environ.get("FILEFORMATS_NO_PYPI_CACHE")
+    if use_cache:
+        try:
+            cache_path = Path(PYPI_CACHE_PATH).expanduser()
+        except RuntimeError:  # the home directory can't be determined
+            use_cache = False
+    cache: ty.Dict[str, ty.Tuple[bool, float]] = {}
+    if use_cache:
+        try:
+            with open(cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if not isinstance(cache, dict):  # e.g. if the file has been overwritten
+            cache = {}
+    try:
+        exists, checked = cache[package_name]
+        if time.time() - checked < PYPI_CACHE_TIMEOUT:
+            return bool(exists)
+    except (KeyError, TypeError, ValueError):
+        pass  # missing or malformed entries are treated as cache misses
+    # urllib.request is only imported here as it is slow to import (it pulls in
+    # http.client, email and ssl) and is only needed on this rarely used error path
+    import urllib.error
+    import urllib.request
+
     url = f"https://pypi.org/pypi/{package_name}/json"
     try:
-        urllib.request.urlopen(url, timeout=timeout)
+        # Only the status code is required, so avoid downloading the JSON body
+        urllib.request.urlopen(
+            urllib.request.Request(url, method="HEAD"), timeout=timeout
+        )
     except urllib.error.HTTPError as e:
         if e.code == 404:
-            return False
+            exists = False
         else:
             raise
-    return True
+    else:
+        exists = True
+    if use_cache:
+        cache[package_name] = (exists, time.time())
+        # Write to a temporary file and move it into place so that concurrent
+        # processes never read a partially written cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            logger.debug("Could not write PyPI package cache to %s", cache_path)
+    return exists
 
 
 class ExtrasModule:
@@ -204,8 +397,6 @@ def import_extras_module(klass: ty.Type["fileformats.core.DataType"]) -> ExtrasM
     sub_pkg : str
         the name of the sub-package that was attempted to be loaded
     """
-    from .identification import IANA_MIME_TYPE_REGISTRIES
-
     # Check for Mock class
     try:
         klass = klass.TRUE_CLASS  # type: ignore
@@ -220,19 +411,28 @@ def import_extras_module(klass: ty.Type["fileformats.core.DataType"]) -> ExtrasM
             klass.__module__,
         )
         return ExtrasModule(True, None, None)
-    sub_pkg = pkg_parts[1]
+    return _import_extras_subpkg(pkg_parts[1])
+
+
+@functools.lru_cache(maxsize=None)
+def _import_extras_subpkg(sub_pkg: str) -> ExtrasModule:
+    # Many classes share the same sub-package so the result is cached by sub-package
+    # instead of by class
+    from .identification import IANA_MIME_TYPE_REGISTRIES
+
     extras_pkg = "fileformats.extras." + sub_pkg
-    if sub_pkg in IANA_MIME_TYPE_REGISTRIES + ["testing"]:
+    if sub_pkg in IANA_MIME_TYPE_REGISTRIES or sub_pkg == "testing":
         extras_pypi = "fileformats-extras"
     else:
         extras_pypi = f"fileformats-{sub_pkg.replace('_', '-')}-extras"
-    try:
-        importlib.import_module(extras_pkg)
-    except ModuleNotFoundError as e:
-        if str(e) != f"No module named '{extras_pkg}'":
-            raise
+    if extras_pkg in sys.modules:
+        extras_imported = True
+    elif importlib.util.find_spec(extras_pkg) is None:
+        # Check whether the extras package is installed before attempting to import
+        # it so the (common) case where it isn't doesn't raise and catch an exception
         extras_imported = False
     else:
+        importlib.import_module(extras_pkg)
         extras_imported = True
     return ExtrasModule(extras_imported, extras_pkg, extras_pypi)
 
@@ -257,8 +457,16 @@ def get_optional_type(
     bool
         whether the type is an Optional type or not
     """
+    return _get_optional_type(type_, allowed)  # type: ignore[arg-type,no-any-return]
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_optional_type(type_: ty.Any, allowed: bool) -> ty.Any:
+    # Types are hashable and immutable, so the result can be cached to avoid
+    # re-inspecting the same content types each time a format is instantiated.
+    # Exceptions aren't cached so invalid types will raise on every call
     if ty.get_origin(type_) is None:
-        return type_  # type: ignore[return-value]
+        return type_
     if not allowed:
         raise FormatDefinitionError(
             f"Optional types are not allowed in content_type definitions ({type_}) "
@@ -270,4 +478,4 @@ def get_optional_type(
             "Only Optional types are allowed in content_type definitions, "
             f"not {type_}"
         )
-    return args[0] if args[0] is not None else args[1]  # type: ignore[no-any-return]
+    return args[0] if args[0] is not None else args[1]
@@ -177,6 +177,14 @@ class Boolean(Singular[bool, bool], LogicalMixin):
 
 ItemType = ty.TypeVar("ItemType", decimal.Decimal, int, float, bool)
 
+# Functions that parse string items directly into the values of the corresponding
+# item types, so large arrays parsed from strings don't need to create a field object
+# for each item
+_STR_ITEM_PARSERS: ty.Dict[type, ty.Callable[[str], ty.Any]] = {
+    Integer: int,
+    Decimal: decimal.Decimal,
+}
+
 
 class Array(
     WithClassifier,
@@ -196,19 +204,14 @@ class Array(
 
     def __init__(self, value: ty.Union[str, ty.Sequence[ty.Any]]):
 
+        from_str = isinstance(value, str)
         if isinstance(value, str):
-            if (value.startswith("[") and value.endswith("]")) or (
-                value.startswith("(") and value.endswith(")")
-            ):
+            first, last = value[:1], value[-1:]
+            if first + last in ("[]", "()"):
                 value = value[1:-1]
-            elif (
-                value.startswith("[")
-                or value.endswith("]")
-                or value.startswith("(")
-                or value.endswith(")")
-            ):
+            elif first in ("[", "(") or last in ("]", ")"):
                 raise FormatMismatchError(f"Unmatched brackets in array field {value}")
-            value = tuple(v.strip() for v in value.split(","))
+            value = tuple(map(str.strip, value.split(",")))
         else:
             try:
                 value = tuple(value)
@@ -217,10 +220,16 @@ class Array(
         assert isinstance(value, tuple)
         # Ensure items are of the correct type
         # if self.item_type is not None:
+        parsed_value: ty.Tuple[ItemType, ...]
         if self.item_type is not None:
-            parsed_value: ty.Tuple[ItemType, ...] = tuple(
-                self.item_type(i).value for i in value
-            )
+            parse_str = _STR_ITEM_PARSERS.get(self.item_type) if from_str else None
+            if parse_str is not None:
+                try:
+                    parsed_value = tuple(map(parse_str, value))
+                except (ValueError, decimal.InvalidOperation) as e:
+                    raise FormatMismatchError(str(e)) from None
+            else:
+                parsed_value = tuple(self.item_type(i).value for i in value)
         else:
             parsed_value = value
         self.value = parsed_value
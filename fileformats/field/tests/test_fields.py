@@ -1,3 +1,4 @@
+import decimal
 import pytest
 from fileformats.core.exceptions import FormatMismatchError
 from fileformats.field import Text, Integer, Decimal, Boolean, Array
@@ -70,12 +71,16 @@ def test_field_array():
     assert str(array) == "[1,2,3,4,5]"
     array = Array("[1, 2, 3, 4, 5]")
     assert str(array) == "[1,2,3,4,5]"
+    array = Array("(1, 2, 3, 4, 5)")
+    assert str(array) == "[1,2,3,4,5]"
     array = Array("1,2,3,4,5")
     assert str(array) == "[1,2,3,4,5]"
     assert list(array) == ["1", "2", "3", "4", "5"]
     array = Array[Integer]("1,2,3,4,5")
     assert str(array) == "[1,2,3,4,5]"
     assert list(array) == [1, 2, 3, 4, 5]
+    array = Array[Decimal]("[1.5, 2.5]")
+    assert list(array) == [decimal.Decimal("1.5"), decimal.Decimal("2.5")]
 
 
 def test_field_array_fail():
@@ -83,3 +88,11 @@ def test_field_array_fail():
         Boolean("1,2,3]")
     with pytest.raises(FormatMismatchError):
         Boolean("[1,2,3")
+    with pytest.raises(FormatMismatchError):
+        Array("[1,2,3")
+    with pytest.raises(FormatMismatchError):
+        Array("(1,2,3]")
+    with pytest.raises(FormatMismatchError):
+        Array[Integer]("1,2,a")
+    with pytest.raises(FormatMismatchError):
+        Array[Decimal]("1.0,2.0,a")
@@ -8,7 +8,7 @@ from fileformats.core.exceptions import (
 )
 from fileformats.core.decorators import (
     validated_property,
-    classproperty,
+    cached_classproperty,
     mtime_cached_property,
 )
 from .fsobject import FsObject
@@ -33,7 +33,7 @@ class File(FsObject):
             )
         return fspath
 
-    @classproperty
+    @cached_classproperty
     def unconstrained(cls) -> bool:
         """Whether the file-format is unconstrained by extension, magic number or another
         constraint"""
@@ -6,7 +6,7 @@ from fileformats.core.fileset import FileSet
 from fileformats.core.exceptions import (
     FormatMismatchError,
 )
-from fileformats.core.decorators import validated_property, classproperty
+from fileformats.core.decorators import validated_property, cached_classproperty
 
 
 class FsObject(FileSet, os.PathLike):  # type: ignore
@@ -37,7 +37,7 @@ class FsObject(FileSet, os.PathLike):  # type: ignore
     def stem(self) -> str:
         return self.fspath.with_suffix("").name
 
-    @classproperty
+    @cached_classproperty
     def unconstrained(cls) -> bool:
         """Whether the file-format is unconstrained by extension, magic number or another
         constraint"""